@@ -54,6 +54,7 @@ setup(
             "pytest>=7.4.3",
             "pytest-asyncio>=0.21.1",
             "pytest-cov>=4.1.0",
+            "pytest-xdist>=3.5.0",
             "black>=23.11.0",
             "pylint>=3.0.0",
             "mypy>=1.7.0",
@@ -6,16 +6,12 @@ Coordonează cele 4 organe [R, B, E, O] folosind ADN fractal
 import json
 import logging
 import sys
+import time
 from pathlib import Path
 from typing import Dict, Any, Tuple, List
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='[%(asctime)s] %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
+logger = logging.getLogger(__name__)
 
 class LambdaArbiter:
     """
@@ -40,7 +36,7 @@ class LambdaArbiter:
                 genome_data = json.load(f)
                 self.genome = genome_data['Λ-genome']
         except Exception as e:
-            logging.error(f"Failed to load genome: {e}")
+            logger.error(f"Failed to load genome: {e}")
             # Fallback to default genome
             self.genome = {
                 "bases": ["R", "B", "E", "O"],
@@ -57,8 +53,12 @@ class LambdaArbiter:
         # Initialize organs (lazy import to avoid circular dependencies)
         self.organs = {}
         self._init_organs()
+
+        # Persistent organ pool: time_wrap runs every pulse beat, so the
+        # workers are created once, not per call
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='organ')
         
-        logging.info(f"🧬 Lambda Arbiter initialized with genome: {self.genome['weights']}")
+        logger.info(f"🧬 Lambda Arbiter initialized with genome: {self.genome['weights']}")
     
     def _init_organs(self):
         """Initialize all 4 organs"""
@@ -79,10 +79,10 @@ class LambdaArbiter:
                 "OPTIMIZE": OptimizeCore(self.genome)
             }
             
-            logging.info(f"✅ Initialized {len(self.organs)} organs")
+            logger.info(f"✅ Initialized {len(self.organs)} organs")
             
         except Exception as e:
-            logging.error(f"Failed to initialize organs: {e}")
+            logger.error(f"Failed to initialize organs: {e}")
             self.organs = {}
     
     def time_wrap(self, health_data: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -98,32 +98,67 @@ class LambdaArbiter:
         """
         if health_data is None:
             health_data = self.get_default_health()
-        
-        results = {}
-        
-        # Parallel execution of all organs
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            # Submit all organ cycles
-            futures = {
-                executor.submit(organ.cycle, health_data): name
-                for name, organ in self.organs.items()
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(futures):
-                organ_name = futures[future]
-                try:
-                    result = future.result(timeout=5.0)
-                    results[organ_name] = result
-                    logging.debug(f"[{organ_name}] Cycle completed: {result.get('action', 'unknown')}")
-                except Exception as e:
-                    logging.error(f"[{organ_name}] Error: {e}")
-                    results[organ_name] = {"error": str(e)}
-        
+
+        results = self._run_organs(health_data)
+
         # Recalibrate based on genome weights
         integrated = self.recalibrate(results)
         
         return integrated
+
+    def time_wrap_into(self, out, health_data: Dict[str, Any] = None):
+        """
+        Time Wrap fără alocarea dict-ului de rezultat
+
+        Fills a reusable result carrier in place instead of building a
+        fresh integrated dict per call - the Pulse loop runs this at
+        1kHz, where the per-beat dict was pure allocator churn.
+
+        Args:
+            out: Carrier with organs/integrated_score/genome_balance/
+                 timestamp attributes (see pulse._BeatResult)
+            health_data: System health metrics
+
+        Returns:
+            The filled carrier
+        """
+        if health_data is None:
+            health_data = self.get_default_health()
+
+        results = self._run_organs(health_data)
+
+        out.organs = results
+        out.integrated_score = self._integrated_score(results)
+        out.genome_balance = self.genome['weights']
+        out.timestamp = time.time()
+        return out
+
+    def _run_organs(self, health_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute all organ cycles in parallel, keyed by organ name"""
+        results = {}
+
+        # Parallel execution of all organs on the persistent pool
+        submit = self._pool.submit
+        futures = {
+            name: submit(organ.cycle, health_data)
+            for name, organ in self.organs.items()
+        }
+
+        # Collect results in submit order (all organs must finish anyway)
+        for organ_name, future in futures.items():
+            try:
+                result = future.result(timeout=5.0)
+                results[organ_name] = result
+                logger.debug(f"[{organ_name}] Cycle completed: {result.get('action', 'unknown')}")
+            except Exception as e:
+                logger.error(f"[{organ_name}] Error: {e}")
+                results[organ_name] = {"error": str(e)}
+
+        return results
+
+    def shutdown(self):
+        """Release the organ worker pool (call when the arbiter retires)"""
+        self._pool.shutdown(wait=False)
     
     def recalibrate(self, organ_results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -135,36 +170,39 @@ class LambdaArbiter:
         Returns:
             Integrated results with weighted score
         """
+        return {
+            "organs": organ_results,
+            "integrated_score": self._integrated_score(organ_results),
+            "genome_balance": self.genome['weights'],
+            "timestamp": self._get_timestamp()
+        }
+
+    def _integrated_score(self, organ_results: Dict[str, Dict[str, Any]]) -> float:
+        """Weighted integration score across organ results"""
         weights = self.genome['weights']
-        
-        # Calculate weighted integration score
+
         integrated_score = 0.0
         total_weight = 0.0
-        
+
         for organ_name, result in organ_results.items():
             # Get organ weight (R, B, E, O)
             organ_key = organ_name[0]  # First letter: R, B, E, O
             weight = weights.get(organ_key, 0.25)
-            
+
             # Simple scoring based on action success
             if 'action' in result and result['action'] != 'error':
                 organ_score = 1.0
             else:
                 organ_score = 0.0
-            
+
             integrated_score += weight * organ_score
             total_weight += weight
-        
+
         # Normalize score
         if total_weight > 0:
             integrated_score /= total_weight
-        
-        return {
-            "organs": organ_results,
-            "integrated_score": integrated_score,
-            "genome_balance": weights,
-            "timestamp": self._get_timestamp()
-        }
+
+        return integrated_score
     
     def get_default_health(self) -> Dict[str, Any]:
         """
@@ -191,7 +229,12 @@ class LambdaArbiter:
 
 def main():
     """Test the Lambda Arbiter"""
-    logging.info("🧬 Lambda Arbiter Test")
+    logging.basicConfig(
+        level=logging.INFO,
+        format='[%(asctime)s] %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    logger.info("🧬 Lambda Arbiter Test")
     
     # Create arbiter
     arbiter = LambdaArbiter()
@@ -209,12 +252,14 @@ def main():
     result = arbiter.time_wrap(health_data)
     
     # Print results
-    logging.info(f"📊 Time Wrap Results:")
-    logging.info(f"   Integrated Score: {result['integrated_score']:.3f}")
-    logging.info(f"   Genome Balance: {result['genome_balance']}")
+    logger.info(f"📊 Time Wrap Results:")
+    logger.info(f"   Integrated Score: {result['integrated_score']:.3f}")
+    logger.info(f"   Genome Balance: {result['genome_balance']}")
     
     for organ_name, organ_result in result['organs'].items():
-        logging.info(f"   [{organ_name}]: {organ_result}")
+        logger.info(f"   [{organ_name}]: {organ_result}")
+
+    arbiter.shutdown()
 
 if __name__ == "__main__":
     main()
@@ -38,14 +38,15 @@ CFG = Config()
 # Logging (thread‑safe, atomic append)
 # -------------------------------------------------------------------
 
-CFG.log_path.parent.mkdir(parents=True, exist_ok=True)
-
-logging.basicConfig(
-    filename=CFG.log_path,
-    level=logging.INFO,
-    format="[+] %(asctime)s %(message)s",
-    datefmt="%c",
-)
+def _configure_logging() -> None:
+    """Set up the file-backed fractal log (worker entry point only)."""
+    CFG.log_path.parent.mkdir(parents=True, exist_ok=True)
+    logging.basicConfig(
+        filename=CFG.log_path,
+        level=logging.INFO,
+        format="[+] %(asctime)s %(message)s",
+        datefmt="%c",
+    )
 
 def log(msg: str) -> None:
     """Append a message to the fractal log."""
@@ -209,6 +210,7 @@ signal.signal(signal.SIGTERM, _handle_sigterm)
 
 def main() -> None:
     """Entry point for the Λ‑Fractal worker."""
+    _configure_logging()
     theta = 0.5  # initial resilience; can be derived from health checks
     log("Λ‑Fractal worker started")
     
@@ -7,6 +7,7 @@ Folosește UDP Multicast pentru a anunța și descoperi nodurile VENOM
 din rețeaua locală. Menține registrul de peer-uri (~/.venom_peers.json).
 """
 
+import os
 import socket
 import struct
 import time
@@ -16,7 +17,26 @@ import threading
 from pathlib import Path
 import logging
 
-logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# orjson support (optional) - Rust-backed JSON, 3-10x faster than stdlib;
+# its JSONDecodeError subclasses json.JSONDecodeError, so handlers stay shared
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=4).encode('utf-8')
+
+    _json_loads = json.loads
 
 # --- Configurație Imutabilă ---
 MULTICAST_GROUP = '224.1.1.1'
@@ -24,6 +44,7 @@ MULTICAST_PORT = 19845
 TTL = 5                               # Time-To-Live pentru pachet
 ANNOUNCEMENT_INTERVAL = 3.0           # Frecvența de anunțare (sec)
 PEER_TIMEOUT = 10.0                   # Timp după care un peer e considerat mort
+SAVE_INTERVAL = 1.0                   # Flush minim între salvări pe disc (sec)
 PEER_FILE = Path.home() / ".venom_peers.json"
 
 # UUID-ul unic al acestui nod
@@ -37,19 +58,49 @@ def load_peers():
     global PEERS
     if PEER_FILE.exists():
         try:
-            PEERS = json.loads(PEER_FILE.read_text())
+            PEERS = _json_loads(PEER_FILE.read_bytes())
             # Convertim adresele la tuple
             for info in PEERS.values():
                 if isinstance(info.get('addr'), list):
                     info['addr'] = tuple(info['addr'])
-            logging.info(f"🕸️ Loaded {len(PEERS)} peers from {PEER_FILE}")
+            logger.info(f"🕸️ Loaded {len(PEERS)} peers from {PEER_FILE}")
         except Exception as e:
-            logging.error(f"Failed to load peers: {e}")
+            logger.error(f"Failed to load peers: {e}")
             PEERS = {}
     
+# Coalescing pentru salvări: update-urile doar marchează registrul dirty,
+# scrierea pe disc rulează cel mult o dată pe SAVE_INTERVAL
+_dirty = False
+_last_save = 0.0
+_last_hash = None
+
 def save_peers():
+    """Marchează registrul dirty; flush-ul efectiv e limitat la 1/sec."""
+    global _dirty
+    _dirty = True
+    _flush_if_due()
+
+def _flush_if_due():
+    """Scrie pe disc doar dacă registrul e dirty și a trecut intervalul."""
+    global _dirty, _last_save
+    if _dirty and time.monotonic() - _last_save > SAVE_INTERVAL:
+        _save_peers_now()
+        _dirty = False
+        _last_save = time.monotonic()
+
+def _save_peers_now():
     """Salvează registrul de peer-uri pe disc (pentru Orchestrator)."""
+    global _last_hash
     try:
+        # Hash structural ieftin: dacă registrul e identic cu ultima
+        # salvare, sărim și serializarea și scrierea
+        table_hash = hash(tuple(sorted(
+            (pid, info.get('last_seen')) for pid, info in PEERS.items()
+        )))
+        if table_hash == _last_hash:
+            logger.debug("💾 Peers unchanged, skipping save")
+            return
+        
         PEER_FILE.parent.mkdir(parents=True, exist_ok=True)
         
         # Asigurăm că adresele sunt liste pentru serializare JSON
@@ -59,22 +110,27 @@ def save_peers():
             if isinstance(serializable_info.get('addr'), tuple):
                 serializable_info['addr'] = list(serializable_info['addr'])
             serializable_peers[pid] = serializable_info
-            
-        PEER_FILE.write_text(json.dumps(serializable_peers, indent=4))
-        logging.debug(f"💾 Saved {len(serializable_peers)} peers to {PEER_FILE}")
+        
+        # Scriere atomică: temp + os.replace, cititorii nu văd fișier parțial
+        tmp_file = PEER_FILE.with_name(PEER_FILE.name + ".tmp")
+        tmp_file.write_bytes(_json_dumps(serializable_peers))
+        os.replace(tmp_file, PEER_FILE)
+        
+        _last_hash = table_hash
+        logger.debug(f"💾 Saved {len(serializable_peers)} peers to {PEER_FILE}")
     except Exception as e:
-        logging.error(f"Failed to save peers: {e}")
+        logger.error(f"Failed to save peers: {e}")
 
 def announce_presence(sock):
     """Trimite un pachet Multicast pentru a anunța prezența."""
     try:
         # Presupunem că venom-api.py rulează pe portul 8000 (CFG.rest_port)
-        message = json.dumps({
+        message = _json_dumps({
             "id": NODE_ID,
             "grpc_port": 8443,
             "rest_port": 8000,
             "timestamp": time.time()
-        }).encode('utf-8')
+        })
         
         sock.sendto(message, (MULTICAST_GROUP, MULTICAST_PORT))
         
@@ -86,9 +142,11 @@ def announce_presence(sock):
             "is_local": True
         }
         
-        logging.debug(f"📡 Announced presence: {NODE_ID[:8]}...")
+        save_peers()
+        
+        logger.debug(f"📡 Announced presence: {NODE_ID[:8]}...")
     except Exception as e:
-        logging.error(f"Announce error: {e}")
+        logger.error(f"Announce error: {e}")
 
 def listen_and_process(sock):
     """Ascultă pachetele Multicast și actualizează registrul."""
@@ -97,7 +155,7 @@ def listen_and_process(sock):
     while True:
         try:
             data, address = sock.recvfrom(1024)
-            message = json.loads(data.decode('utf-8'))
+            message = _json_loads(data)
             
             peer_id = message.get("id")
             grpc_port = message.get("grpc_port", 8443)
@@ -115,14 +173,16 @@ def listen_and_process(sock):
                 "is_local": False
             }
             
-            logging.debug(f"🔗 Discovered peer: {peer_id[:8]}... at {peer_address}")
+            save_peers()
+            
+            logger.debug(f"🔗 Discovered peer: {peer_id[:8]}... at {peer_address}")
             
         except socket.timeout:
-            pass
+            _flush_if_due()
         except json.JSONDecodeError as e:
-            logging.warning(f"Invalid JSON received: {e}")
+            logger.warning(f"Invalid JSON received: {e}")
         except Exception as e:
-            logging.error(f"Listen error: {e}")
+            logger.error(f"Listen error: {e}")
 
 def cleanup_peers():
     """Curăță peer-urile care nu au mai anunțat de mult timp."""
@@ -134,13 +194,13 @@ def cleanup_peers():
             to_remove.append(peer_id)
             
     for peer_id in to_remove:
-        logging.info(f"🗑️ Removing stale peer: {peer_id[:8]}...")
+        logger.info(f"🗑️ Removing stale peer: {peer_id[:8]}...")
         del PEERS[peer_id]
 
 def multicast_daemon():
     """Funcția principală a Daemon-ului Multicast."""
     
-    logging.info(f"🕸️ VENOM Mesh Discovery Daemon starting (ID: {NODE_ID[:8]}...)")
+    logger.info(f"🕸️ VENOM Mesh Discovery Daemon starting (ID: {NODE_ID[:8]}...)")
     
     # 1. Socket de trimis
     send_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
@@ -154,43 +214,41 @@ def multicast_daemon():
     try:
         recv_sock.bind(('', MULTICAST_PORT))
     except OSError as e:
-        logging.error(f"Failed to bind to port {MULTICAST_PORT}: {e}")
+        logger.error(f"Failed to bind to port {MULTICAST_PORT}: {e}")
         return
 
     # Join multicast group
     mreq = struct.pack("4sl", socket.inet_aton(MULTICAST_GROUP), socket.INADDR_ANY)
     recv_sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
     
-    logging.info(f"🕸️ Listening on {MULTICAST_GROUP}:{MULTICAST_PORT}")
+    logger.info(f"🕸️ Listening on {MULTICAST_GROUP}:{MULTICAST_PORT}")
 
     # 3. Start thread-ul de ascultare
     listen_thread = threading.Thread(target=lambda: listen_and_process(recv_sock), daemon=True)
     listen_thread.start()
     
     # 4. Loop-ul principal de anunțare și curățare
-    last_save = 0
     try:
         while True:
             announce_presence(send_sock)
             cleanup_peers()
             
-            # Salvează la fiecare 1 secundă
-            if time.time() - last_save > 1:
-                save_peers()
-                last_save = time.time()
+            # save_peers() în announce marchează dirty; aici doar flush
+            _flush_if_due()
                 
             time.sleep(ANNOUNCEMENT_INTERVAL)
     except KeyboardInterrupt:
-        logging.info("\n🛑 Daemon stopped by user")
+        logger.info("\n🛑 Daemon stopped by user")
     except Exception as e:
-        logging.error(f"Daemon error: {e}")
+        logger.error(f"Daemon error: {e}")
     finally:
         send_sock.close()
         recv_sock.close()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(levelname)s - %(message)s')
     load_peers()
     try:
         multicast_daemon()
     except Exception as e:
-        logging.error(f"Fatal error: {e}")
+        logger.error(f"Fatal error: {e}")
@@ -13,6 +13,8 @@ from typing import List, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
+
 from fastapi import FastAPI
 import uvicorn
 
@@ -93,6 +95,58 @@ def grav_mode(s: float, theta: float, k: float, p: float, u: float) -> Tuple[str
     if s_int == float("inf"): return fallback(theta)[0], 0.0
     raise ValueError("invalid state")
 
+# ======================================================
+# Variante batch vectorizate (NumPy)
+# Pulse-ul apelează funcțiile Λ per beat; pe vectori de stări costul
+# devine o singură trecere C în loc de N dispatch-uri Python
+# ======================================================
+
+def fractal_total_batch(states, thetas) -> np.ndarray:
+    """Λ‑Fractal Tetrastrat, vectorizat
+
+    Returnează numele stării pentru fiecare element; stările din afara
+    {-1, 0, 1} cad pe benzile theta din fallback().
+    """
+    states = np.asarray(states)
+    thetas = np.asarray(thetas, dtype=float)
+
+    fallback_names = np.where(
+        thetas >= CFG.theta_high, "Regen",
+        np.where(thetas >= CFG.theta_low, "Neutral", "Entropy")
+    )
+    return np.where(
+        states == 1, "Regen",
+        np.where(states == 0, "Neutral",
+                 np.where(states == -1, "Entropy", fallback_names))
+    )
+
+def mobius_time_batch(states, k, p, u, t1: float = CFG.t1) -> np.ndarray:
+    """Λ‑Möbius Temporal, vectorizat
+
+    Aceeași aritmetică pe stări ca mobius_time, calculată cu np.select
+    pe toate elementele deodată; starea ∞ (fallback, o acțiune) devine
+    valoarea implicită t1.
+    """
+    states = np.asarray(states)
+    k = np.asarray(k, dtype=float)
+    p = np.asarray(p, dtype=float)
+    u = np.asarray(u, dtype=float)
+
+    kp = k * p
+    logu = np.log(u)
+    wrap = (t1 * logu) / (1 - 1.0 / kp)
+    neutral = t1 * logu
+
+    # Seria geometrică sum_{i<10} (k*p)^i, fără buclă Python
+    powers = np.power(kp[..., np.newaxis], np.arange(10))
+    entropy = ((t1 * logu)[..., np.newaxis] * powers).sum(axis=-1)
+
+    return np.select(
+        [states == 1, states == 0, states == -1],
+        [wrap, neutral, entropy],
+        default=t1,
+    )
+
 # ======================================================
 # REST API (FastAPI)
 # ======================================================
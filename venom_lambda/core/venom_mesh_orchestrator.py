@@ -3,6 +3,7 @@ Mesh Orchestrator Service
 Coordinates task distribution across mesh nodes
 """
 
+import heapq
 import logging
 import json
 import time
@@ -11,7 +12,6 @@ import sys
 from pathlib import Path
 from typing import Dict, List, Any
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 PEERS_FILE = Path.home() / '.venom_peers.json'
@@ -25,12 +25,17 @@ class MeshOrchestrator:
         self.load_tracking: Dict[str, float] = {}
         self.running = False
         
+        # Min-heap of (load, node_id) with lazy deletion: entries whose
+        # load no longer matches load_tracking are skipped on pop
+        self._load_heap: List[Any] = []
+        
     def load_peers(self):
         """Load peers from discovery file"""
         try:
             if PEERS_FILE.exists():
                 with open(PEERS_FILE, 'r') as f:
                     self.peers = json.load(f)
+                self._reseed_heap()
                 logger.info(f"Loaded {len(self.peers)} peers")
         except Exception as e:
             logger.error(f"Failed to load peers: {e}")
@@ -43,28 +48,52 @@ class MeshOrchestrator:
         last_seen = self.peers[node_id].get('last_seen', 0)
         return (time.time() - last_seen) < 60  # 1 minute threshold
     
+    def _reseed_heap(self):
+        """Rebuild the load heap from the current peer set"""
+        self._load_heap = [
+            (self.load_tracking.get(node_id, 0.0), node_id)
+            for node_id in self.peers
+        ]
+        heapq.heapify(self._load_heap)
+    
+    def _pop_least_loaded(self):
+        """Pop the least loaded healthy node, skipping stale heap entries"""
+        heap = self._load_heap
+        while heap:
+            load, node_id = heapq.heappop(heap)
+            if not self.health_check(node_id):
+                continue  # lazy delete: node gone or unhealthy
+            if load != self.load_tracking.get(node_id, 0.0):
+                continue  # stale entry: load changed since it was pushed
+            return node_id, load
+        return None
+    
     def dispatch_task(self, task: Dict[str, Any]) -> str:
         """
         Dispatch task to least loaded node
         
+        O(log N) heap pop/push instead of a full scan of the peer table;
+        the heap is reseeded when lazy deletion has drained it (e.g.
+        after the periodic load decay invalidates every entry).
+        
         Returns:
             Node ID where task was dispatched
         """
-        # Find least loaded healthy node
-        candidates = [
-            node_id for node_id in self.peers.keys()
-            if self.health_check(node_id)
-        ]
+        found = self._pop_least_loaded()
+        if found is None and self.peers:
+            self._reseed_heap()
+            found = self._pop_least_loaded()
         
-        if not candidates:
+        if found is None:
             logger.warning("No healthy nodes available")
             return None
         
-        # Select node with lowest load
-        selected = min(candidates, key=lambda n: self.recent_load(n))
+        selected, load = found
         
-        # Update load tracking (using EMA)
-        self.load_tracking[selected] = self.recent_load(selected) * 0.9 + 1.0
+        # Update load tracking (using EMA) and requeue at the new load
+        new_load = load * 0.9 + 1.0
+        self.load_tracking[selected] = new_load
+        heapq.heappush(self._load_heap, (new_load, selected))
         
         logger.info(f"Dispatched task to {selected}")
         return selected
@@ -105,6 +134,7 @@ def signal_handler(signum, frame):
 
 def main():
     """Main entry point"""
+    logging.basicConfig(level=logging.INFO)
     signal.signal(signal.SIGTERM, signal_handler)
     signal.signal(signal.SIGINT, signal_handler)
     
@@ -9,7 +9,30 @@ import time
 import logging
 from typing import Dict, Any, Optional
 
-logging.basicConfig(level=logging.INFO)
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Signal-log ring size (power of two so indexing is a mask, not a modulo)
+_SIGNAL_RING_SIZE = 1024
+_SIGNAL_RING_MASK = _SIGNAL_RING_SIZE - 1
+
+# Capacity of the structure-of-arrays receive-counter block
+_MAX_NODES = 1024
+
+# Sentinel that tells the dispatcher loop to exit
+_STOP = object()
+
+
+class _TreeEnvelope:
+    """Broadcast payload travelling down the fanout tree"""
+
+    __slots__ = ("sender", "data")
+
+    def __init__(self, sender: str, data: Any):
+        self.sender = sender
+        self.data = data
+
 
 class Mesh:
     """
@@ -19,16 +42,39 @@ class Mesh:
     
     def __init__(self):
         self.nodes: Dict[str, Any] = {}  # NanoBots
-        self.message_queue = queue.Queue()
         self.alive = False
-        self.signal_log = []
+
+        self._delivery_thread: Optional[threading.Thread] = None
+
+        # One MPSC queue feeds the single dispatcher thread: SimpleQueue
+        # puts are lock-free in CPython, so concurrent senders never
+        # contend with each other or with delivery
+        self._inq = queue.SimpleQueue()
+
+        # Signal log: preallocated ring, overwritten in place - readers
+        # snapshot the head counter, so no lock on either side
+        self._signal_ring = [None] * _SIGNAL_RING_SIZE
+        self._signal_head = 0
+        
+        # Structure-of-arrays receive counters: each meshed bot gets a
+        # slot here, so swarm-wide aggregates are one vectorized sum
+        self._msgs_received = np.zeros(_MAX_NODES, dtype=np.int64)
+        self._node_slots: Dict[str, int] = {}
+        self._free_slots: list = []
+        self._next_slot = 0
+        
+        # Fanout broadcast tree: each node forwards to at most `fanout`
+        # children, so no single sender pays O(N) egress
+        self.fanout = 2
+        self._tree_children: Dict[str, list] = {}
+        self._tree_root: Optional[str] = None
         
         # Statistics
         self.messages_delivered = 0
         self.messages_dropped = 0
         self.total_nodes = 0
         
-        logging.info("🕸️ Mesh Network initialized")
+        logger.info("🕸️ Mesh Network initialized")
     
     def add_node(self, node_id: str, node_ref: Any):
         """
@@ -40,8 +86,24 @@ class Mesh:
         """
         self.nodes[node_id] = node_ref
         self.total_nodes += 1
+        self._rebuild_tree()
         
-        logging.info(f"🔗 Mesh: Added node {node_id} (total: {len(self.nodes)})")
+        # Move the bot's receive counter into the shared SoA block; past
+        # capacity the bot simply keeps its private counter
+        bind = getattr(node_ref, "bind_counter", None)
+        if bind is not None:
+            if self._free_slots:
+                slot = self._free_slots.pop()
+            elif self._next_slot < _MAX_NODES:
+                slot = self._next_slot
+                self._next_slot += 1
+            else:
+                slot = None
+            if slot is not None:
+                self._node_slots[node_id] = slot
+                bind(self._msgs_received, slot)
+        
+        logger.info(f"🔗 Mesh: Added node {node_id} (total: {len(self.nodes)})")
     
     def remove_node(self, node_id: str):
         """
@@ -51,8 +113,50 @@ class Mesh:
             node_id: Node identifier to remove
         """
         if node_id in self.nodes:
-            del self.nodes[node_id]
-            logging.info(f"🔗 Mesh: Removed node {node_id} (remaining: {len(self.nodes)})")
+            node = self.nodes.pop(node_id)
+            slot = self._node_slots.pop(node_id, None)
+            if slot is not None:
+                node.unbind_counter()
+                self._free_slots.append(slot)
+            self._rebuild_tree()
+            logger.info(f"🔗 Mesh: Removed node {node_id} (remaining: {len(self.nodes)})")
+    
+    def _rebuild_tree(self):
+        """
+        Rebuild the balanced fanout tree over the current nodes
+        
+        Node i's children are positions fanout*i+1 .. fanout*i+fanout in
+        insertion order - a balanced k-ary tree, no weights needed.
+        """
+        order = list(self.nodes)
+        k = self.fanout
+        children = {}
+        for i, nid in enumerate(order):
+            kids = order[k * i + 1:k * i + 1 + k]
+            if kids:
+                children[nid] = kids
+        self._tree_children = children
+        self._tree_root = order[0] if order else None
+    
+    def broadcast_tree(self, sender: str, data: Any):
+        """
+        Broadcast prin arborele fanout (egress limitat per nod)
+        
+        The message enters at the tree root and every node forwards it to
+        at most `fanout` children during delivery, so the sender pays one
+        push instead of N-1 while the total stays O(N). The sender's own
+        node forwards but does not receive.
+        
+        Args:
+            sender: Node ID of sender
+            data: Data to broadcast
+        """
+        root = self._tree_root
+        if root is None:
+            return
+        
+        self._inq.put((root, _TreeEnvelope(sender, data)))
+        logger.debug(f"📡 Mesh: Tree broadcast from {sender} via root {root}")
     
     def broadcast(self, sender: str, data: Any):
         """
@@ -64,17 +168,15 @@ class Mesh:
         """
         broadcast_count = 0
         
-        for nid, ref in self.nodes.items():
+        # Lock-free puts into the shared dispatcher queue
+        inq_put = self._inq.put
+        for nid in self.nodes:
             if nid != sender:  # Don't send back to sender
-                try:
-                    self.message_queue.put((nid, data), timeout=0.001)
-                    broadcast_count += 1
-                except queue.Full:
-                    self.messages_dropped += 1
-                    logging.warning(f"⚠️ Mesh: Message queue full, dropped message to {nid}")
+                inq_put((nid, data))
+                broadcast_count += 1
         
         if broadcast_count > 0:
-            logging.debug(f"📡 Mesh: Broadcast from {sender} to {broadcast_count} nodes")
+            logger.debug(f"📡 Mesh: Broadcast from {sender} to {broadcast_count} nodes")
     
     def send(self, recipient: str, data: Any):
         """
@@ -85,89 +187,134 @@ class Mesh:
             data: Data to send
         """
         if recipient in self.nodes:
-            try:
-                self.message_queue.put((recipient, data), timeout=0.001)
-            except queue.Full:
-                self.messages_dropped += 1
-                logging.warning(f"⚠️ Mesh: Message queue full, dropped message to {recipient}")
+            self._inq.put((recipient, data))
     
     def deliver(self):
         """
         Loop de livrare mesaje (impulsuri nervoase)
-        1ms delivery fractal
+        Single dispatcher consuming the MPSC queue - the blocking get
+        wakes the instant a message arrives, no 1ms polling
         """
-        logging.info("🕸️ Mesh: Delivery loop started")
+        logger.info("🕸️ Mesh: Delivery loop started")
         
-        while self.alive:
+        inq = self._inq
+        while True:
+            item = inq.get()
+            if item is _STOP:
+                break
+            
+            nid, data = item
+            node = self.nodes.get(nid)
+            if node is None:
+                self.messages_dropped += 1
+                continue
+            
+            # Tree broadcasts: forward to this node's children before
+            # local delivery, then unwrap the payload
+            if type(data) is _TreeEnvelope:
+                for child in self._tree_children.get(nid, ()):
+                    inq.put((child, data))
+                if nid == data.sender:
+                    continue
+                data = data.data
+            
+            # Skip deactivated nodes (apoptosis) before doing any
+            # delivery work - inactive bots cost nothing per signal
+            if not node.active:
+                self.messages_dropped += 1
+                continue
+            
             try:
-                # Non-blocking check for messages
-                if not self.message_queue.empty():
-                    nid, data = self.message_queue.get(timeout=0.001)
-                    
-                    if nid in self.nodes:
-                        try:
-                            # Deliver message (like neuron firing)
-                            self.nodes[nid].receive(data)
-                            
-                            # Log signal
-                            self.signal_log.append({
-                                "timestamp": time.time(),
-                                "recipient": nid,
-                                "data": str(data)[:50]  # First 50 chars
-                            })
-                            
-                            self.messages_delivered += 1
-                            
-                            # Keep only last 1000 signals
-                            if len(self.signal_log) > 1000:
-                                self.signal_log = self.signal_log[-1000:]
-                                
-                        except Exception as e:
-                            logging.error(f"❌ Mesh: Delivery error to {nid}: {e}")
-                            self.messages_dropped += 1
+                # Deliver message (like neuron firing)
+                node.receive(data)
                 
-                # 1ms fractal delivery
-                time.sleep(0.001)
+                # Log signal (ring write: one store + increment)
+                self._signal_ring[self._signal_head & _SIGNAL_RING_MASK] = {
+                    "timestamp": time.time(),
+                    "recipient": nid,
+                    "data": str(data)[:50]  # First 50 chars
+                }
+                self._signal_head += 1
+                
+                self.messages_delivered += 1
                 
-            except queue.Empty:
-                time.sleep(0.001)
             except Exception as e:
-                logging.error(f"❌ Mesh: Delivery loop error: {e}")
-                time.sleep(0.001)
+                logger.error(f"❌ Mesh: Delivery error to {nid}: {e}")
+                self.messages_dropped += 1
+    
+    def reset(self):
+        """
+        Readuce mesh-ul la starea inițială fără a-l realoca
+        
+        Lets a long-lived instance (e.g. a shared test fixture) be
+        reused instead of constructing a fresh Mesh per use.
+        """
+        if self.alive:
+            self.stop()
+        
+        self.nodes.clear()
+        self._rebuild_tree()
+        
+        # Drain anything still queued for the dispatcher
+        while True:
+            try:
+                self._inq.get_nowait()
+            except queue.Empty:
+                break
+        
+        self._msgs_received[:] = 0
+        self._node_slots.clear()
+        self._free_slots.clear()
+        self._next_slot = 0
+        
+        self._signal_ring = [None] * _SIGNAL_RING_SIZE
+        self._signal_head = 0
+        self.messages_delivered = 0
+        self.messages_dropped = 0
+        self.total_nodes = 0
+        
+        logger.info("🕸️ Mesh Network: RESET")
     
     def start(self):
         """
         Pornește mesh-ul
         """
         if self.alive:
-            logging.warning("🕸️ Mesh: Already running")
+            logger.warning("🕸️ Mesh: Already running")
             return
         
         self.alive = True
         
         # Start delivery thread
-        delivery_thread = threading.Thread(target=self.deliver, daemon=True)
-        delivery_thread.start()
+        self._delivery_thread = threading.Thread(target=self.deliver, daemon=True)
+        self._delivery_thread.start()
         
-        logging.info(f"🕸️ Mesh Network: STARTED (nodes: {len(self.nodes)})")
+        logger.info(f"🕸️ Mesh Network: STARTED (nodes: {len(self.nodes)})")
     
     def stop(self):
         """
         Oprește mesh-ul
         """
         if not self.alive:
-            logging.warning("🕸️ Mesh: Not running")
+            logger.warning("🕸️ Mesh: Not running")
             return
         
         self.alive = False
+        self._inq.put(_STOP)
+        
+        # Join the dispatcher: it exits as soon as it drains up to the
+        # sentinel, so callers block only as long as delivery actually takes
+        if self._delivery_thread is not None:
+            self._delivery_thread.join(timeout=1.0)
+            self._delivery_thread = None
         
         # Log final statistics
-        logging.info(f"""
+        logger.info(f"""
 🕸️ Mesh Network: STOPPED
    - Total nodes: {self.total_nodes}
    - Messages delivered: {self.messages_delivered}
    - Messages dropped: {self.messages_dropped}
-   - Signals logged: {len(self.signal_log)}
+   - Signals logged: {self._signal_head}
         """.strip())
     
     def get_vitals(self) -> Dict[str, Any]:
@@ -180,10 +327,11 @@ class Mesh:
         return {
             "alive": self.alive,
             "nodes": len(self.nodes),
-            "messages_pending": self.message_queue.qsize(),
+            "messages_pending": self._inq.qsize(),
             "messages_delivered": self.messages_delivered,
+            "messages_received_total": int(self._msgs_received.sum()),
             "messages_dropped": self.messages_dropped,
-            "signals_logged": len(self.signal_log),
+            "signals_logged": self._signal_head,
             "total_nodes_created": self.total_nodes
         }
     
@@ -200,7 +348,7 @@ class Mesh:
             try:
                 states[nid] = node.get_state()
             except Exception as e:
-                logging.error(f"Error getting state for {nid}: {e}")
+                logger.error(f"Error getting state for {nid}: {e}")
                 states[nid] = {"error": str(e)}
         
         return states
@@ -213,18 +361,24 @@ class Mesh:
             count: Number of recent signals to return
             
         Returns:
-            List of recent signals
+            List of recent signals (oldest first)
         """
-        return self.signal_log[-count:]
+        # Snapshot the head once: a concurrent write just makes the
+        # window a beat stale, which is fine for "recent"
+        head = self._signal_head
+        count = min(count, head, _SIGNAL_RING_SIZE)
+        ring = self._signal_ring
+        return [ring[i & _SIGNAL_RING_MASK] for i in range(head - count, head)]
 
 
 def main():
     """
     Test Mesh Network
     """
+    logging.basicConfig(level=logging.INFO)
     from nanobot import NanoBot
     
-    logging.info("🕸️ Testing Mesh Network...")
+    logger.info("🕸️ Testing Mesh Network...")
     
     # Create mesh
     mesh = Mesh()
@@ -250,17 +404,17 @@ def main():
     
     # Get vitals
     vitals = mesh.get_vitals()
-    logging.info(f"🕸️ Mesh vitals: {vitals}")
+    logger.info(f"🕸️ Mesh vitals: {vitals}")
     
     # Get node states
     states = mesh.get_node_states()
     for nid, state in states.items():
-        logging.info(f"   [{nid}]: {state}")
+        logger.info(f"   [{nid}]: {state}")
     
     # Stop mesh
     mesh.stop()
     
-    logging.info("🕸️ Test completed")
+    logger.info("🕸️ Test completed")
 
 
 if __name__ == "__main__":
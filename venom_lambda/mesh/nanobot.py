@@ -5,9 +5,22 @@ Păstrează memorie locală și procesează semnale (ca un neuron)
 
 import logging
 import time
+from collections import deque
 from typing import Any, Dict, List
 
-logging.basicConfig(level=logging.INFO)
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Role -> memory capacity, resolved with one dict lookup at init instead
+# of a chain of string compares; unknown roles fall back to generic
+_ROLE_CAPACITY = {
+    "memory_carrier": 200,      # High capacity for storing data
+    "signal_relay": 50,          # Low capacity, fast relay
+    "knowledge_keeper": 500,     # Very high capacity for knowledge
+    "generic": 100               # Default capacity
+}
+_VALID_ROLES = frozenset(_ROLE_CAPACITY)
 
 class NanoBot:
     """
@@ -25,35 +38,47 @@ class NanoBot:
             role: NanoBot role (memory_carrier, signal_relay, knowledge_keeper, generic)
         """
         self.node_id = node_id
-        self.role = role
-        self.memory: List[Dict[str, Any]] = []
+        self.role = role if role in _VALID_ROLES else "generic"
         self.active = True
         
-        # Statistics
-        self.messages_received = 0
+        # Statistics. The receive counter lives in an int64 array slot
+        # (structure-of-arrays): a standalone bot owns a private 1-slot
+        # array, a meshed bot is rebound into the mesh-wide array so the
+        # swarm total is one vectorized sum instead of N attribute reads
+        self._rx_counts = np.zeros(1, dtype=np.int64)
+        self.node_index = 0
         self.messages_processed = 0
         self.created_at = time.time()
         
-        # Role-specific capacity
-        self.memory_capacity = self._get_memory_capacity()
+        # Role-specific capacity; the deque ring drops the oldest entry
+        # in O(1) when full - no manual trim, no list reallocation
+        self.memory_capacity = _ROLE_CAPACITY[self.role]
+        self.memory: deque = deque(maxlen=self.memory_capacity)
         
-        logging.info(f"🤖 NanoBot {node_id} created (role: {role})")
+        logger.info(f"🤖 NanoBot {node_id} created (role: {role})")
     
-    def _get_memory_capacity(self) -> int:
+    @property
+    def messages_received(self) -> int:
+        """Number of signals received (read from the counter slot)"""
+        return int(self._rx_counts[self.node_index])
+    
+    def bind_counter(self, counts: np.ndarray, index: int):
         """
-        Get memory capacity based on role
+        Rebind the receive counter into a shared mesh-wide array
         
-        Returns:
-            Maximum number of messages to store
+        Args:
+            counts: Mesh-owned int64 counter array
+            index: This bot's slot in the array
         """
-        capacities = {
-            "memory_carrier": 200,      # High capacity for storing data
-            "signal_relay": 50,          # Low capacity, fast relay
-            "knowledge_keeper": 500,     # Very high capacity for knowledge
-            "generic": 100               # Default capacity
-        }
-        
-        return capacities.get(self.role, 100)
+        counts[index] = self._rx_counts[self.node_index]
+        self._rx_counts = counts
+        self.node_index = index
+    
+    def unbind_counter(self):
+        """Detach from a shared counter array, keeping the current count"""
+        count = self._rx_counts[self.node_index]
+        self._rx_counts = np.array([count], dtype=np.int64)
+        self.node_index = 0
     
     def receive(self, data: Any):
         """
@@ -65,7 +90,7 @@ class NanoBot:
         if not self.active:
             return
         
-        self.messages_received += 1
+        self._rx_counts[self.node_index] += 1
         
         # Store message with metadata
         message = {
@@ -79,12 +104,7 @@ class NanoBot:
         # Process based on role
         self._process_message(message)
         
-        # Keep memory within capacity (FIFO eviction)
-        if len(self.memory) > self.memory_capacity:
-            evicted = self.memory.pop(0)
-            logging.debug(f"🤖 [{self.node_id}] Evicted old message (capacity: {self.memory_capacity})")
-        
-        logging.debug(f"🤖 [{self.node_id}] Received: {str(data)[:50]}")
+        logger.debug(f"🤖 [{self.node_id}] Received: {str(data)[:50]}")
     
     def _process_message(self, message: Dict[str, Any]):
         """
@@ -133,42 +153,79 @@ class NanoBot:
             "uptime_seconds": uptime
         }
     
-    def query_memory(self, filter_fn=None) -> List[Dict[str, Any]]:
+    def get_state_fast(self) -> tuple:
+        """
+        Lightweight state snapshot for high-rate monitoring
+
+        Avoids the dict allocation and derived fields of get_state when
+        a swarm-wide health collector polls thousands of bots.
+
+        Returns:
+            Tuple of (node_id, active, memory_size, messages_received)
+        """
+        return (self.node_id, self.active, len(self.memory), self.messages_received)
+
+    def query_memory(self, filter_fn=None, contains: str = None) -> List[Dict[str, Any]]:
         """
         Query stored memory
         
+        The `contains` form is the fast path for the common substring
+        query: one C-level `in` per message instead of a Python-level
+        callback invocation.
+        
         Args:
             filter_fn: Optional filter function
+            contains: Optional substring to match in text payloads
             
         Returns:
             List of matching messages
         """
+        if contains is not None:
+            return [msg for msg in self.memory
+                    if isinstance(msg["data"], str) and contains in msg["data"]]
+        
         if filter_fn is None:
-            return self.memory.copy()
+            return list(self.memory)
         
         return [msg for msg in self.memory if filter_fn(msg)]
-    
+
+    def recent(self, window_sec: float) -> List[Dict[str, Any]]:
+        """
+        Get messages received in the last window_sec seconds
+
+        The cutoff is computed once, so each message costs a single
+        float compare (unlike a filter lambda recomputing time.time()).
+
+        Args:
+            window_sec: Window size in seconds
+
+        Returns:
+            List of messages newer than the cutoff
+        """
+        cutoff = time.time() - window_sec
+        return [msg for msg in self.memory if msg["timestamp"] > cutoff]
+
     def clear_memory(self):
         """
         Clear all stored memory
         """
         cleared_count = len(self.memory)
         self.memory.clear()
-        logging.info(f"🤖 [{self.node_id}] Memory cleared ({cleared_count} messages)")
+        logger.info(f"🤖 [{self.node_id}] Memory cleared ({cleared_count} messages)")
     
     def deactivate(self):
         """
         Deactivate nanobot (apoptosis)
         """
         self.active = False
-        logging.info(f"🤖 [{self.node_id}] Deactivated (apoptosis)")
+        logger.info(f"🤖 [{self.node_id}] Deactivated (apoptosis)")
     
     def reactivate(self):
         """
         Reactivate nanobot
         """
         self.active = True
-        logging.info(f"🤖 [{self.node_id}] Reactivated")
+        logger.info(f"🤖 [{self.node_id}] Reactivated")
     
     def __repr__(self) -> str:
         return f"NanoBot({self.node_id}, role={self.role}, memory={len(self.memory)}/{self.memory_capacity})"
@@ -178,7 +235,8 @@ def main():
     """
     Test NanoBot
     """
-    logging.info("🤖 Testing NanoBot...")
+    logging.basicConfig(level=logging.INFO)
+    logger.info("🤖 Testing NanoBot...")
     
     # Create nanobots with different roles
     roles = ["memory_carrier", "signal_relay", "knowledge_keeper", "generic"]
@@ -194,26 +252,24 @@ def main():
             nanobot.receive(f"Test message {j} for {nanobot.node_id}")
     
     # Get states
-    logging.info("\n🤖 NanoBot States:")
+    logger.info("\n🤖 NanoBot States:")
     for nanobot in nanobots:
         state = nanobot.get_state()
-        logging.info(f"   {nanobot}")
-        logging.info(f"      Usage: {state['memory_usage']:.1%}")
-        logging.info(f"      Processed: {state['messages_processed']}")
+        logger.info(f"   {nanobot}")
+        logger.info(f"      Usage: {state['memory_usage']:.1%}")
+        logger.info(f"      Processed: {state['messages_processed']}")
     
     # Test memory query
     memory_carrier = nanobots[0]
-    recent_messages = memory_carrier.query_memory(
-        lambda msg: msg["timestamp"] > time.time() - 10
-    )
-    logging.info(f"\n🤖 Recent messages in {memory_carrier.node_id}: {len(recent_messages)}")
+    recent_messages = memory_carrier.recent(10)
+    logger.info(f"\n🤖 Recent messages in {memory_carrier.node_id}: {len(recent_messages)}")
     
     # Test deactivation
     nanobots[1].deactivate()
     nanobots[1].receive("This should not be stored")
-    logging.info(f"\n🤖 Deactivated nanobot memory: {len(nanobots[1].memory)}")
+    logger.info(f"\n🤖 Deactivated nanobot memory: {len(nanobots[1].memory)}")
     
-    logging.info("\n🤖 Test completed")
+    logger.info("\n🤖 Test completed")
 
 
 if __name__ == "__main__":
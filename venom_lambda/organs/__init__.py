@@ -1,11 +1,32 @@
 """
 Λ-Genesis Organs Module
 Core biological-inspired processing units
+
+Organ classes are imported lazily (PEP 562) so that importing one organ
+does not pay the import cost of the other three.
 """
 
-from .regen_core import RegenCore
-from .balance_core import BalanceCore
-from .entropy_core import EntropyCore
-from .optimize_core import OptimizeCore
+import importlib
 
 __all__ = ["RegenCore", "BalanceCore", "EntropyCore", "OptimizeCore"]
+
+_ORGAN_MODULES = {
+    "RegenCore": "regen_core",
+    "BalanceCore": "balance_core",
+    "EntropyCore": "entropy_core",
+    "OptimizeCore": "optimize_core",
+}
+
+
+def __getattr__(name):
+    module_name = _ORGAN_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    organ = getattr(module, name)
+    globals()[name] = organ  # cache for subsequent lookups
+    return organ
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -4,9 +4,20 @@ Flow: Stabilize  Conserve  Maintain
 """
 
 import logging
+from bisect import bisect_right
 from typing import Dict, Any
 
-logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Stability ladder: theta edges and the mode/description for each band
+_THETA_EDGES = (0.3, 0.5, 0.7, 0.9)
+_MODES = (
+    ("unwrap_mode", "UNWRAP", " - conserve energy"),
+    ("transition_mode", "TRANSITION", ""),
+    ("balance_mode", "OPTIMAL", ""),
+    ("wrap_mode", "WRAP", " - high performance"),
+    ("optimize_mode", "OPTIMIZE", " - maximum power"),
+)
 
 class BalanceCore:
     """
@@ -20,7 +31,7 @@ class BalanceCore:
         self.state = "balanced"
         self.balance_adjustments = 0
         
-        logging.info(f"⚖️ BALANCE Core initialized (weight: {self.weight})")
+        logger.info("⚖️ BALANCE Core initialized (weight: %s)", self.weight)
     
     def cycle(self, health_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -32,13 +43,15 @@ class BalanceCore:
         Returns:
             Dict with cycle results
         """
+        # Unpack health metrics once - helpers work on scalars
         theta = health_data.get('theta', 0.5)
-        
+        battery_level = health_data.get('battery_level', 100)
+
         # STABILIZE: Ajustează balanța
         stability = self.stabilize(theta)
         
         # CONSERVE: Conservă energie
-        conservation = self.conserve(health_data)
+        conservation = self.conserve(battery_level)
         
         # MAINTAIN: Menține echilibrul
         maintenance = self.maintain()
@@ -67,45 +80,30 @@ class BalanceCore:
         Returns:
             Stability mode
         """
-        if theta < 0.3:
-            mode = "unwrap_mode"
-            logging.info(f"⚖️ [BALANCE] Stabilizing: UNWRAP (θ={theta:.2f}) - conserve energy")
-        elif theta < 0.5:
-            mode = "transition_mode"
-            logging.info(f"⚖️ [BALANCE] Stabilizing: TRANSITION (θ={theta:.2f})")
-        elif theta < 0.7:
-            mode = "balance_mode"
-            logging.info(f"⚖️ [BALANCE] Stabilizing: OPTIMAL (θ={theta:.2f})")
-        elif theta < 0.9:
-            mode = "wrap_mode"
-            logging.info(f"⚖️ [BALANCE] Stabilizing: WRAP (θ={theta:.2f}) - high performance")
-        else:
-            mode = "optimize_mode"
-            logging.info(f"⚖️ [BALANCE] Stabilizing: OPTIMIZE (θ={theta:.2f}) - maximum power")
-        
+        mode, label, note = _MODES[bisect_right(_THETA_EDGES, theta)]
+        logger.info("⚖️ [BALANCE] Stabilizing: %s (θ=%.2f)%s", label, theta, note)
+
         return mode
     
-    def conserve(self, health_data: Dict[str, Any]) -> str:
+    def conserve(self, battery_level: float) -> str:
         """
         Conservă energie când e necesar
         
         Args:
-            health_data: System health metrics
+            battery_level: Battery level percentage (0-100)
             
         Returns:
             Conservation level
         """
-        battery_level = health_data.get('battery_level', 100)
-        
         if battery_level < 20:
             conservation = "aggressive_conservation"
-            logging.warning(f"🔋 [BALANCE] Conservation: AGGRESSIVE (battery: {battery_level}%)")
+            logger.warning("🔋 [BALANCE] Conservation: AGGRESSIVE (battery: %s%%)", battery_level)
         elif battery_level < 50:
             conservation = "moderate_conservation"
-            logging.info(f"🔋 [BALANCE] Conservation: MODERATE (battery: {battery_level}%)")
+            logger.info("🔋 [BALANCE] Conservation: MODERATE (battery: %s%%)", battery_level)
         else:
             conservation = "normal_operation"
-            logging.debug(f"🔋 [BALANCE] Conservation: NORMAL (battery: {battery_level}%)")
+            logger.debug("🔋 [BALANCE] Conservation: NORMAL (battery: %s%%)", battery_level)
         
         return conservation
     
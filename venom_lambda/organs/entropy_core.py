@@ -4,9 +4,17 @@ Flow: Self-Attack  Detect  Defend  Learn
 """
 
 import logging
+from collections import deque
 from typing import Dict, Any, List
 
-logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Threat detection table: (health_data key, threshold, threat name)
+_THREAT_CHECKS = (
+    ("cpu_health", 0.1, "cpu_spike"),
+    ("memory_health", 0.2, "memory_attack"),
+    ("thermal_health", 0.3, "thermal_attack"),
+)
 
 class EntropyCore:
     """
@@ -17,10 +25,11 @@ class EntropyCore:
     def __init__(self, genome: Dict[str, Any]):
         self.genome = genome
         self.weight = genome['weights']['E']  # 0.15
-        self.learned_threats = []
+        self.learned_threats = set()
+        self._threat_order = deque(maxlen=100)  # insertion order, for FIFO eviction
         self.defense_count = 0
         
-        logging.info(f"🛡️ ENTROPY Core initialized (weight: {self.weight})")
+        logger.info("🛡️ ENTROPY Core initialized (weight: %s)", self.weight)
     
     def cycle(self, health_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -75,10 +84,10 @@ class EntropyCore:
         for attack in test_attacks:
             if not self.is_defended_against(attack):
                 vulnerabilities.append(attack)
-                logging.warning(f"🔍 [ENTROPY] Vulnerability found: {attack}")
+                logger.warning("🔍 [ENTROPY] Vulnerability found: %s", attack)
         
         if not vulnerabilities:
-            logging.debug(f"✅ [ENTROPY] Self-attack: all defenses intact")
+            logger.debug("✅ [ENTROPY] Self-attack: all defenses intact")
         
         return vulnerabilities
     
@@ -93,25 +102,13 @@ class EntropyCore:
             List of detected threats
         """
         threats = []
-        
-        # CPU spike anomaly
-        cpu_health = health_data.get('cpu_health', 1.0)
-        if cpu_health < 0.1:
-            threats.append("cpu_spike")
-            logging.warning(f"⚠️ [ENTROPY] Threat detected: cpu_spike (health: {cpu_health:.2f})")
-        
-        # Memory anomaly
-        memory_health = health_data.get('memory_health', 1.0)
-        if memory_health < 0.2:
-            threats.append("memory_attack")
-            logging.warning(f"⚠️ [ENTROPY] Threat detected: memory_attack (health: {memory_health:.2f})")
-        
-        # Thermal attack (sustained overheating)
-        thermal_health = health_data.get('thermal_health', 1.0)
-        if thermal_health < 0.3:
-            threats.append("thermal_attack")
-            logging.warning(f"⚠️ [ENTROPY] Threat detected: thermal_attack (health: {thermal_health:.2f})")
-        
+
+        for key, threshold, threat in _THREAT_CHECKS:
+            health = health_data.get(key, 1.0)
+            if health < threshold:
+                threats.append(threat)
+                logger.warning("⚠️ [ENTROPY] Threat detected: %s (health: %.2f)", threat, health)
+
         return threats
     
     def defend(self, threats: List[str]) -> int:
@@ -124,19 +121,20 @@ class EntropyCore:
         Returns:
             Number of threats defended
         """
-        defended_count = 0
-        
+        known = 0
+        learning = 0
+
         for threat in threats:
             if threat in self.learned_threats:
                 # Known threat - effective defense
-                logging.info(f"🛡️ [ENTROPY] Defended (known): {threat}")
-                defended_count += 1
+                logger.info("🛡️ [ENTROPY] Defended (known): %s", threat)
+                known += 1
             else:
-                # New threat - partial defense
-                logging.info(f"🛡️ [ENTROPY] Defended (learning): {threat}")
-                defended_count += 0.5
-        
-        return int(defended_count)
+                # New threat - partial defense (counts half)
+                logger.info("🛡️ [ENTROPY] Defended (learning): %s", threat)
+                learning += 1
+
+        return known + learning // 2
     
     def learn(self, threats: List[str]):
         """
@@ -145,14 +143,15 @@ class EntropyCore:
         Args:
             threats: List of threats to learn from
         """
+        order = self._threat_order
         for threat in threats:
             if threat not in self.learned_threats:
-                self.learned_threats.append(threat)
-                logging.info(f"🧠 [ENTROPY] Learned new threat: {threat}")
-        
-        # Keep only last 100 threats
-        if len(self.learned_threats) > 100:
-            self.learned_threats = self.learned_threats[-100:]
+                # Cap at 100 threats: a full deque drops the oldest in O(1)
+                if len(order) == order.maxlen:
+                    self.learned_threats.discard(order[0])
+                self.learned_threats.add(threat)
+                order.append(threat)
+                logger.info("🧠 [ENTROPY] Learned new threat: %s", threat)
     
     def is_defended_against(self, attack: str) -> bool:
         """
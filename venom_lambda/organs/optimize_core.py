@@ -4,9 +4,25 @@ Flow: Detect  Adjust  Redistribute  Restart
 """
 
 import logging
+from types import MappingProxyType
 from typing import Dict, Any, List
 
-logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Resource distributions per theta band (read-only: returned by reference)
+_DIST_UNWRAP = MappingProxyType({"REGEN": 40, "BALANCE": 30, "ENTROPY": 15, "OPTIMIZE": 15})
+_DIST_BALANCE = MappingProxyType({"REGEN": 25, "BALANCE": 35, "ENTROPY": 20, "OPTIMIZE": 20})
+_DIST_OPTIMIZE = MappingProxyType({"REGEN": 20, "BALANCE": 25, "ENTROPY": 20, "OPTIMIZE": 35})
+
+# Target -> (adjustment label, log description)
+_ADJUSTMENTS = {
+    "quantize_model": ("model_quantized_int8", "model → INT8 quantization"),
+    "increase_threads": ("threads_increased", "threads → increased parallelism"),
+    "optimize_cache": ("cache_optimized", "cache → LRU eviction policy"),
+}
+
+# Adjustments that require an engine restart
+_CRITICAL_ADJUSTMENTS = frozenset({"model_quantized_int8", "threads_increased"})
 
 class OptimizeCore:
     """
@@ -20,7 +36,7 @@ class OptimizeCore:
         self.optimizations = []
         self.optimization_count = 0
         
-        logging.info(f"⚡ OPTIMIZE Core initialized (weight: {self.weight})")
+        logger.info("⚡ OPTIMIZE Core initialized (weight: %s)", self.weight)
     
     def cycle(self, health_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -32,14 +48,20 @@ class OptimizeCore:
         Returns:
             Dict with cycle results
         """
+        # Unpack health metrics once - helpers work on scalars
+        theta = health_data.get('theta', 0.5)
+        model_size = health_data.get('model_size', 0)
+        cpu_cores = health_data.get('cpu_cores', 4)
+        cache_hit_rate = health_data.get('cache_hit_rate', 1.0)
+
         # DETECT: Ce poate fi optimizat
-        targets = self.detect_optimization_targets(health_data)
+        targets = self.detect_optimization_targets(theta, model_size, cpu_cores, cache_hit_rate)
         
         # ADJUST: Ajustează parametri
         adjustments = self.adjust(targets)
         
         # REDISTRIBUTE: Redistribuie resurse
-        redistributed = self.redistribute(health_data)
+        redistributed = self.redistribute(theta)
         
         # RESTART: Restart componente optimizate
         restarted = self.restart_if_needed(adjustments)
@@ -56,36 +78,36 @@ class OptimizeCore:
             "total_optimizations": self.optimization_count
         }
     
-    def detect_optimization_targets(self, health_data: Dict[str, Any]) -> List[str]:
+    def detect_optimization_targets(self, theta: float, model_size: int,
+                                    cpu_cores: int, cache_hit_rate: float) -> List[str]:
         """
         Detectează ce poate fi optimizat
         
         Args:
-            health_data: System health metrics
+            theta: System health (0-1)
+            model_size: Model size in bytes
+            cpu_cores: Available CPU cores
+            cache_hit_rate: Cache hit rate (0-1)
             
         Returns:
             List of optimization targets
         """
         targets = []
-        theta = health_data.get('theta', 0.5)
         
         # Model size optimization
-        model_size = health_data.get('model_size', 0)
         if theta < 0.5 and model_size > 1_000_000_000:
             targets.append("quantize_model")
-            logging.info(f"🎯 [OPTIMIZE] Target: quantize_model (size: {model_size / 1e9:.2f}GB)")
+            logger.info("🎯 [OPTIMIZE] Target: quantize_model (size: %.2fGB)", model_size / 1e9)
         
         # Thread optimization
-        cpu_cores = health_data.get('cpu_cores', 4)
         if cpu_cores > 4:
             targets.append("increase_threads")
-            logging.info(f"🎯 [OPTIMIZE] Target: increase_threads (cores: {cpu_cores})")
+            logger.info("🎯 [OPTIMIZE] Target: increase_threads (cores: %s)", cpu_cores)
         
         # Cache optimization
-        cache_hit_rate = health_data.get('cache_hit_rate', 1.0)
         if cache_hit_rate < 0.7:
             targets.append("optimize_cache")
-            logging.info(f"🎯 [OPTIMIZE] Target: optimize_cache (hit rate: {cache_hit_rate:.2f})")
+            logger.info("🎯 [OPTIMIZE] Target: optimize_cache (hit rate: %.2f)", cache_hit_rate)
         
         return targets
     
@@ -100,49 +122,41 @@ class OptimizeCore:
             List of adjustments made
         """
         adjustments = []
-        
+
         for target in targets:
-            if target == "quantize_model":
-                adjustments.append("model_quantized_int8")
-                logging.info(f"⚙️ [OPTIMIZE] Adjusted: model → INT8 quantization")
-                
-            elif target == "increase_threads":
-                adjustments.append("threads_increased")
-                logging.info(f"⚙️ [OPTIMIZE] Adjusted: threads → increased parallelism")
-                
-            elif target == "optimize_cache":
-                adjustments.append("cache_optimized")
-                logging.info(f"⚙️ [OPTIMIZE] Adjusted: cache → LRU eviction policy")
-        
+            entry = _ADJUSTMENTS.get(target)
+            if entry is None:
+                continue
+            adjustments.append(entry[0])
+            logger.info("⚙️ [OPTIMIZE] Adjusted: %s", entry[1])
+
         return adjustments
     
-    def redistribute(self, health_data: Dict[str, Any]) -> Dict[str, int]:
+    def redistribute(self, theta: float) -> Dict[str, int]:
         """
         Redistribuie resurse bazat pe prioritate
         
         Args:
-            health_data: System health metrics
+            theta: System health (0-1)
             
         Returns:
             Dict with resource distribution percentages
         """
-        theta = health_data.get('theta', 0.5)
-        
         if theta < 0.3:
             # UNWRAP: Most to REGEN
-            distribution = {"REGEN": 40, "BALANCE": 30, "ENTROPY": 15, "OPTIMIZE": 15}
-            logging.info(f"📊 [OPTIMIZE] Redistributed: UNWRAP mode (REGEN priority)")
-        
+            distribution = _DIST_UNWRAP
+            logger.info("📊 [OPTIMIZE] Redistributed: UNWRAP mode (REGEN priority)")
+
         elif theta < 0.7:
             # BALANCE: Balanced distribution
-            distribution = {"REGEN": 25, "BALANCE": 35, "ENTROPY": 20, "OPTIMIZE": 20}
-            logging.info(f"📊 [OPTIMIZE] Redistributed: BALANCE mode (equilibrium)")
-        
+            distribution = _DIST_BALANCE
+            logger.info("📊 [OPTIMIZE] Redistributed: BALANCE mode (equilibrium)")
+
         else:
             # OPTIMIZE: Most to performance
-            distribution = {"REGEN": 20, "BALANCE": 25, "ENTROPY": 20, "OPTIMIZE": 35}
-            logging.info(f"📊 [OPTIMIZE] Redistributed: OPTIMIZE mode (performance)")
-        
+            distribution = _DIST_OPTIMIZE
+            logger.info("📊 [OPTIMIZE] Redistributed: OPTIMIZE mode (performance)")
+
         return distribution
     
     def restart_if_needed(self, adjustments: List[str]) -> str:
@@ -155,12 +169,10 @@ class OptimizeCore:
         Returns:
             Restart status
         """
-        critical_adjustments = ["model_quantized_int8", "threads_increased"]
-        
-        needs_restart = any(adj in critical_adjustments for adj in adjustments)
-        
+        needs_restart = not _CRITICAL_ADJUSTMENTS.isdisjoint(adjustments)
+
         if needs_restart:
-            logging.info(f"🔄 [OPTIMIZE] Restart required for: {adjustments}")
+            logger.info("🔄 [OPTIMIZE] Restart required for: %s", adjustments)
             return "model_engine_restarted"
         else:
             return "no_restart_needed"
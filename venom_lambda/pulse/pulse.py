@@ -4,13 +4,113 @@ Beat: 1ms fractal → Time Wrap parallel execution
 Synchronized with Möbius Engine (Ω)
 """
 
+import asyncio
+import mmap
+import struct
 import threading
 import time
 import logging
+from collections import deque
 from pathlib import Path
 from typing import Optional, Dict, Any
 
-logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Numba support (optional) - compiles the metrics arithmetic to native code
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+__all__ = ["PulseFractal", "read_pulse_log"]
+
+# Binary pulse log: fixed-size records in a preallocated mmap ring.
+# Layout: 8-byte head counter, then _LOG_RECORDS slots of (beat, ts, score)
+_REC = struct.Struct('<qdd')
+_HEADER = struct.Struct('<q')
+_LOG_RECORDS = 8192
+_RING_BYTES = _HEADER.size + _LOG_RECORDS * _REC.size
+
+
+def read_pulse_log(path):
+    """
+    Read back the binary pulse ring (oldest first)
+
+    Returns:
+        List of (beat, timestamp, score) tuples
+    """
+    with open(path, 'rb') as f:
+        data = f.read(_RING_BYTES)
+    if len(data) < _RING_BYTES:
+        return []
+    head = _HEADER.unpack_from(data, 0)[0]
+    if head <= 0:
+        return []
+    count = min(head, _LOG_RECORDS)
+    return [
+        _REC.unpack_from(data, _HEADER.size + (i % _LOG_RECORDS) * _REC.size)
+        for i in range(head - count, head)
+    ]
+
+# Sentinel for "no beat measured yet" (any real duration is smaller)
+_NS_UNSET = (1 << 63) - 1
+
+# Pulse log location, resolved once; the directory is created on first
+# PulseFractal construction only (tests build many instances)
+_LOG_PATH = Path.home() / ".venom" / "pulse.log"
+
+# Single-line stat records: lazy %-formatting, no multiline f-string build
+_MILESTONE_FMT = "💓 Pulse Milestone %d: avg=%.3fms min=%.3fms max=%.3fms total=%d"
+_FINAL_STATS_FMT = ("💓 Pulse Final: total=%d uptime=%.2fs "
+                    "avg=%.3fms min=%.3fms max=%.3fms cycle=%.3fms")
+_LOG_READY = False
+_LOG_LOCK = threading.Lock()
+
+
+def _update_metrics_kernel(beat_ns, total_ns, min_ns, max_ns):
+    """Pure beat-metrics update: running total plus min/max, all int64"""
+    total_ns += beat_ns
+    if beat_ns < min_ns:
+        min_ns = beat_ns
+    if beat_ns > max_ns:
+        max_ns = beat_ns
+    return total_ns, min_ns, max_ns
+
+
+if NUMBA_AVAILABLE:
+    _update_metrics_kernel = numba.njit(cache=True)(_update_metrics_kernel)
+
+
+def _ensure_log_dir():
+    global _LOG_READY
+    if not _LOG_READY:
+        with _LOG_LOCK:
+            if not _LOG_READY:
+                _LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+                _LOG_READY = True
+
+
+class _BeatResult:
+    """
+    Reusable carrier for Time Wrap results
+
+    One instance per PulseFractal, refilled in place every beat by
+    LambdaArbiter.time_wrap_into - no per-beat dict allocation. The
+    dict-style get() keeps log_pulse compatible with plain dicts from
+    external callers.
+    """
+
+    __slots__ = ("organs", "integrated_score", "genome_balance", "timestamp")
+
+    def __init__(self):
+        self.organs = None
+        self.integrated_score = 0.0
+        self.genome_balance = None
+        self.timestamp = 0.0
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
 
 class PulseFractal:
     """
@@ -39,62 +139,158 @@ class PulseFractal:
         else:
             self.cycle_time = 0.001  # 1ms fractal beat
             self.adaptive_timing = False
+        self.cycle_ns = int(self.cycle_time * 1e9)
+        # (last seen compression, adjusted cycle) - compression changes
+        # rarely, so the adaptive cycle is recomputed only on change
+        self._adaptive_cache = (None, self.cycle_time)
         
-        # Pulse log
-        self.log_path = Path.home() / ".venom" / "pulse.log"
-        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        # Pulse log: beats append to a bounded in-memory ring; a background
+        # thread flushes to disk so the beat path never touches the filesystem
+        _ensure_log_dir()
+        self.log_path = _LOG_PATH
+        self._log_buf = deque(maxlen=8192)
+        self._flush_interval = 0.1
+
+        # mmap ring state, created lazily so tests can repoint log_path
+        self._ring_mm = None
+        self._ring_file = None
+        self._ring_path = None
+        self._ring_head = 0
+
+        # Reusable beat-result carrier (filled in place each beat)
+        self._beat_result = _BeatResult()
+
+        # Reusable vitals dict, updated in place by get_vitals
+        self._vitals = {
+            "alive": False,
+            "beat_count": 0,
+            "total_beats": 0,
+            "cycle_time_ms": self.cycle_time * 1000,
+            "avg_beat_time_ms": 0.0,
+            "min_beat_time_ms": float('inf'),
+            "max_beat_time_ms": 0.0,
+            "adaptive_timing": self.adaptive_timing
+        }
         
-        # Performance metrics
-        self.avg_beat_time = 0.0
-        self.min_beat_time = float('inf')
-        self.max_beat_time = 0.0
+        # Performance metrics, integer nanoseconds (float only on readout).
+        # The average is an exact running total divided on read, so the
+        # invariant min <= avg <= max holds with no rounding drift.
+        self.total_beat_ns = 0
+        self.beat_samples = 0
+        self.min_beat_ns = _NS_UNSET
+        self.max_beat_ns = 0
         
-        logging.info(f"💓 Pulse Fractal initialized (cycle: {self.cycle_time * 1000:.3f}ms)")
+        logger.info("💓 Pulse Fractal initialized (cycle: %.3fms)", self.cycle_time * 1000)
     
     def beat(self):
         """
         Puls fractal: Time Wrap
         Toate organele [R,B,E,O] lucrează simultan
         """
-        logging.info(f"💓 Pulse Fractal: BEATING...")
-        
+        logger.info("💓 Pulse Fractal: BEATING...")
+
+        # Bind hot names to locals once: every lookup inside the loop is
+        # then a LOAD_FAST instead of attribute resolution at 1kHz - the
+        # pure-Python stand-in for compiling the loop body
+        monotonic_ns = time.monotonic_ns
+        sleep = time.sleep
+        time_wrap_into = self.lambda_arbiter.time_wrap_into
+        log_pulse = self.log_pulse
+        update_metrics = self._update_metrics
+        beat_result = self._beat_result
+
+        cycle_ns = self.cycle_ns
+        next_deadline = monotonic_ns()
+
         while self.alive:
-            beat_start = time.time()
-            
+            beat_start = monotonic_ns()
+
             try:
-                # TIME WRAP: Execuție paralelă organe
-                results = self.lambda_arbiter.time_wrap()
+                # TIME WRAP: Execuție paralelă organe (in-place, no per-beat dict)
+                time_wrap_into(beat_result)
                 
                 # Log pulse
-                self.log_pulse(results)
+                log_pulse(beat_result)
                 
                 # Increment beat counter
                 self.beat_count += 1
                 self.total_beats += 1
                 
                 # Calculate beat duration
-                beat_duration = time.time() - beat_start
-                self._update_metrics(beat_duration)
+                update_metrics(monotonic_ns() - beat_start)
                 
                 # Adjust cycle time from Möbius if available
                 if self.adaptive_timing and self.mobius_engine:
-                    adjusted_cycle = self._calculate_adaptive_cycle()
-                    sleep_time = max(0, adjusted_cycle - beat_duration)
+                    cycle_ns = int(self._calculate_adaptive_cycle() * 1e9)
+
+                # Fixed-phase schedule: advance the absolute deadline so
+                # sleep jitter does not accumulate beat after beat
+                next_deadline += cycle_ns
+                delay_ns = next_deadline - monotonic_ns()
+                if delay_ns > 0:
+                    sleep(delay_ns / 1e9)
                 else:
-                    sleep_time = max(0, self.cycle_time - beat_duration)
-                
-                # Sleep until next beat
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
+                    # Slow beat: realign instead of bursting catch-up beats
+                    next_deadline = monotonic_ns()
                 
                 # Log milestone beats
                 if self.beat_count % 1000 == 0:
                     self._log_milestone()
                 
             except Exception as e:
-                logging.error(f"💓 Pulse error: {e}")
-                time.sleep(self.cycle_time)
+                logger.error("💓 Pulse error: %s", e)
+                sleep(cycle_ns / 1e9)
+                next_deadline = monotonic_ns()
     
+    async def beat_async(self):
+        """
+        Puls fractal asincron - același Time Wrap, rulat într-un event loop
+
+        Shares log_pulse/_update_metrics with the threaded beat(), so both
+        paths stay a single implementation with one set of metrics.
+        """
+        logger.info("💓 Pulse Fractal: BEATING (async)...")
+
+        loop = asyncio.get_running_loop()
+        interval = self.cycle_time
+        next_deadline = loop.time() + interval
+
+        while self.alive:
+            beat_start = time.monotonic_ns()
+
+            try:
+                results = self._beat_result
+                self.lambda_arbiter.time_wrap_into(results)
+                self.log_pulse(results)
+
+                self.beat_count += 1
+                self.total_beats += 1
+
+                beat_duration_ns = time.monotonic_ns() - beat_start
+                self._update_metrics(beat_duration_ns)
+
+                if self.adaptive_timing and self.mobius_engine:
+                    interval = self._calculate_adaptive_cycle()
+
+                # Absolute deadlines on the event-loop clock: sleep until
+                # the next deadline so wakeup jitter never accumulates
+                delay = next_deadline - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                next_deadline += interval
+
+                # Slow beat: realign instead of bursting catch-up beats
+                if loop.time() - next_deadline > interval:
+                    next_deadline = loop.time() + interval
+
+                if self.beat_count % 1000 == 0:
+                    self._log_milestone()
+
+            except Exception as e:
+                logger.error("💓 Pulse error: %s", e)
+                await asyncio.sleep(interval)
+                next_deadline = loop.time() + interval
+
     def log_pulse(self, results: Dict[str, Any]):
         """
         Log puls vital
@@ -103,27 +299,84 @@ class PulseFractal:
             results: Results from Lambda time_wrap
         """
         try:
-            timestamp = time.time()
-            
-            # Append to log file
-            with open(self.log_path, "a") as f:
-                log_entry = f"[PULSE {self.beat_count}] {timestamp}: {results}\n"
-                f.write(log_entry)
-            
-            # Debug log every 100 beats
-            if self.beat_count % 100 == 0:
-                score = results.get('integrated_score', 0)
-                logging.debug(f"💓 Pulse {self.beat_count}: Score={score:.3f}")
-                
+            score = results.get('integrated_score', 0.0)
+
+            # O(1) append, no syscall; the flusher drains this periodically
+            self._log_buf.append((self.beat_count, time.time(), score))
+
+            # Debug log every 100 beats; the level check runs at most
+            # once per 100 beats, the format string only when enabled
+            if self.beat_count % 100 == 0 and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("💓 Pulse %d: Score=%.3f", self.beat_count, score)
+
         except Exception as e:
-            logging.error(f"Log pulse error: {e}")
+            logger.error("Log pulse error: %s", e)
+
+    def _ensure_ring(self):
+        """
+        Map the ring file for the current log_path (created on demand)
+        """
+        if self._ring_mm is not None and self._ring_path == self.log_path:
+            return self._ring_mm
+
+        if self._ring_mm is not None:
+            self._ring_mm.close()
+            self._ring_file.close()
+
+        f = open(self.log_path, "a+b")
+        f.seek(0, 2)
+        if f.tell() < _RING_BYTES:
+            f.truncate(_RING_BYTES)
+        self._ring_file = f
+        self._ring_mm = mmap.mmap(f.fileno(), _RING_BYTES)
+        self._ring_path = self.log_path
+        # Resume the head counter so restarts keep appending in order
+        self._ring_head = max(0, _HEADER.unpack_from(self._ring_mm, 0)[0])
+        return self._ring_mm
+
+    def _flush_log(self):
+        """
+        Drain buffered pulse entries into the mmap ring
+
+        Each entry is a fixed 24-byte struct store - no text formatting,
+        no per-entry syscall, and disk usage is bounded by the ring.
+        """
+        buf = self._log_buf
+        if not buf:
+            return
+
+        try:
+            mm = self._ensure_ring()
+            head = self._ring_head
+            header_size = _HEADER.size
+            rec = _REC
+            rec_size = rec.size
+
+            while buf:
+                beat, ts, score = buf.popleft()
+                rec.pack_into(mm, header_size + (head % _LOG_RECORDS) * rec_size,
+                              beat, ts, score)
+                head += 1
+
+            self._ring_head = head
+            _HEADER.pack_into(mm, 0, head)
+        except Exception as e:
+            logger.error("Log flush error: %s", e)
+
+    def _flush_loop(self):
+        """
+        Background flusher: batch pulse entries to disk every flush interval
+        """
+        while self.alive:
+            time.sleep(self._flush_interval)
+            self._flush_log()
     
     def start(self):
         """
         Pornește inima fractală
         """
         if self.alive:
-            logging.warning(f"💓 Pulse already running")
+            logger.warning("💓 Pulse already running")
             return
         
         self.alive = True
@@ -132,23 +385,30 @@ class PulseFractal:
         # Start beat thread
         beat_thread = threading.Thread(target=self.beat, daemon=True)
         beat_thread.start()
+
+        # Start log flusher thread
+        flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+        flush_thread.start()
         
-        logging.info(f"💓 Pulse Fractal: STARTED (thread: {beat_thread.name})")
+        logger.info("💓 Pulse Fractal: STARTED (thread: %s)", beat_thread.name)
     
     def stop(self):
         """
         Oprește inima fractală
         """
         if not self.alive:
-            logging.warning(f"💓 Pulse not running")
+            logger.warning("💓 Pulse not running")
             return
         
         self.alive = False
-        
+
+        # Flush any buffered pulse entries
+        self._flush_log()
+
         # Log final statistics
         self._log_final_stats()
         
-        logging.info(f"💓 Pulse Fractal: STOPPED (total beats: {self.total_beats})")
+        logger.info("💓 Pulse Fractal: STOPPED (total beats: %d)", self.total_beats)
     
     def _calculate_adaptive_cycle(self) -> float:
         """
@@ -159,92 +419,112 @@ class PulseFractal:
         """
         try:
             # Get compression factor from Möbius
-            # compression = self.mobius_engine.total_speedup()
-            # For now, use fixed compression
-            compression = 1.0
-            
-            # Adaptive cycle time based on compression
-            adjusted_cycle = self.cycle_time / (compression ** 0.1)
-            
-            # Clamp to reasonable range [0.5ms, 10ms]
-            return max(0.0005, min(adjusted_cycle, 0.01))
+            compression = self.mobius_engine.total_speedup() if self.mobius_engine else 1.0
+
+            # Memoized: recompute only when compression actually changed
+            if compression == self._adaptive_cache[0]:
+                return self._adaptive_cache[1]
+
+            # Adaptive cycle time based on compression,
+            # clamped to reasonable range [0.5ms, 10ms]
+            adjusted_cycle = max(0.0005, min(self.cycle_time / (compression ** 0.1), 0.01))
+            self._adaptive_cache = (compression, adjusted_cycle)
+            return adjusted_cycle
             
         except Exception as e:
-            logging.error(f"Adaptive cycle calculation error: {e}")
+            logger.error("Adaptive cycle calculation error: %s", e)
             return self.cycle_time
     
-    def _update_metrics(self, beat_duration: float):
+    def _update_metrics(self, beat_ns: int):
         """
         Update performance metrics
         
         Args:
-            beat_duration: Duration of this beat in seconds
+            beat_ns: Duration of this beat in nanoseconds
         """
-        # Update average (exponential moving average)
-        alpha = 0.1
-        self.avg_beat_time = alpha * beat_duration + (1 - alpha) * self.avg_beat_time
-        
-        # Update min/max
-        self.min_beat_time = min(self.min_beat_time, beat_duration)
-        self.max_beat_time = max(self.max_beat_time, beat_duration)
+        # Thin shim over the (optionally Numba-compiled) pure kernel
+        self.total_beat_ns, self.min_beat_ns, self.max_beat_ns = _update_metrics_kernel(
+            beat_ns, self.total_beat_ns, self.min_beat_ns, self.max_beat_ns
+        )
+        self.beat_samples += 1
+
+    @property
+    def avg_beat_ns(self) -> int:
+        """Exact average beat duration in nanoseconds (integer division)"""
+        if not self.beat_samples:
+            return 0
+        return self.total_beat_ns // self.beat_samples
+
+    @property
+    def avg_beat_time(self) -> float:
+        """Average beat duration in seconds"""
+        return self.avg_beat_ns / 1e9
+
+    @property
+    def min_beat_time(self) -> float:
+        """Minimum beat duration in seconds"""
+        if self.min_beat_ns == _NS_UNSET:
+            return float('inf')
+        return self.min_beat_ns / 1e9
+
+    @property
+    def max_beat_time(self) -> float:
+        """Maximum beat duration in seconds"""
+        return self.max_beat_ns / 1e9
     
     def _log_milestone(self):
         """
         Log milestone statistics (every 1000 beats)
         """
-        logging.info(f"""
-💓 Pulse Milestone: {self.beat_count} beats
-   - Avg beat time: {self.avg_beat_time * 1000:.3f}ms
-   - Min beat time: {self.min_beat_time * 1000:.3f}ms
-   - Max beat time: {self.max_beat_time * 1000:.3f}ms
-   - Total beats: {self.total_beats}
-        """.strip())
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(_MILESTONE_FMT, self.beat_count,
+                        self.avg_beat_ns / 1e6, self.min_beat_ns / 1e6,
+                        self.max_beat_ns / 1e6, self.total_beats)
     
     def _log_final_stats(self):
         """
         Log final statistics when stopping
         """
-        uptime = self.total_beats * self.cycle_time
-        
-        logging.info(f"""
-💓 Pulse Final Statistics:
-   - Total beats: {self.total_beats}
-   - Uptime: {uptime:.2f}s ({uptime / 60:.2f}min)
-   - Avg beat time: {self.avg_beat_time * 1000:.3f}ms
-   - Min beat time: {self.min_beat_time * 1000:.3f}ms
-   - Max beat time: {self.max_beat_time * 1000:.3f}ms
-   - Cycle time: {self.cycle_time * 1000:.3f}ms
-        """.strip())
+        if logger.isEnabledFor(logging.INFO):
+            uptime = self.total_beats * self.cycle_time
+            logger.info(_FINAL_STATS_FMT, self.total_beats, uptime,
+                        self.avg_beat_ns / 1e6, self.min_beat_ns / 1e6,
+                        self.max_beat_ns / 1e6, self.cycle_time * 1000)
     
     def get_vitals(self) -> Dict[str, Any]:
         """
         Get pulse vitals
         
+        The same dict instance is refreshed and returned on every call,
+        so scrape-heavy exporters do not allocate per poll. Callers must
+        treat it as read-only (copy() it to keep a snapshot).
+        
         Returns:
             Dict with pulse statistics
         """
-        return {
-            "alive": self.alive,
-            "beat_count": self.beat_count,
-            "total_beats": self.total_beats,
-            "cycle_time_ms": self.cycle_time * 1000,
-            "avg_beat_time_ms": self.avg_beat_time * 1000,
-            "min_beat_time_ms": self.min_beat_time * 1000,
-            "max_beat_time_ms": self.max_beat_time * 1000,
-            "adaptive_timing": self.adaptive_timing
-        }
+        vitals = self._vitals
+        vitals["alive"] = self.alive
+        vitals["beat_count"] = self.beat_count
+        vitals["total_beats"] = self.total_beats
+        vitals["cycle_time_ms"] = self.cycle_time * 1000
+        vitals["avg_beat_time_ms"] = self.avg_beat_time * 1000
+        vitals["min_beat_time_ms"] = self.min_beat_time * 1000
+        vitals["max_beat_time_ms"] = self.max_beat_time * 1000
+        vitals["adaptive_timing"] = self.adaptive_timing
+        return vitals
 
 
 def main():
     """
     Test Pulse Fractal
     """
+    logging.basicConfig(level=logging.INFO)
     import sys
     sys.path.insert(0, str(Path(__file__).parent.parent))
     
     from arbiter_core.arbiter import LambdaArbiter
     
-    logging.info("💓 Testing Pulse Fractal...")
+    logger.info("💓 Testing Pulse Fractal...")
     
     # Create arbiter
     arbiter = LambdaArbiter()
@@ -260,12 +540,12 @@ def main():
     
     # Get vitals
     vitals = pulse.get_vitals()
-    logging.info(f"💓 Pulse vitals: {vitals}")
+    logger.info("💓 Pulse vitals: %s", vitals)
     
     # Stop pulse
     pulse.stop()
     
-    logging.info("💓 Test completed")
+    logger.info("💓 Test completed")
 
 
 if __name__ == "__main__":
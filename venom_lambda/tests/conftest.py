@@ -0,0 +1,48 @@
+"""
+Shared fixtures pentru suita de teste venom_lambda
+"""
+import socket
+import time
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _no_network(request, monkeypatch):
+    """
+    Fail fast on accidental network I/O
+
+    Unit tests mock their sockets; an unmocked socket() call means a
+    test is about to bind or wait on the real network, so turn it into
+    an immediate error instead of a multi-second hang. Tests that truly
+    need loopback can opt out with @pytest.mark.enable_socket.
+    """
+    if request.node.get_closest_marker("enable_socket"):
+        yield
+        return
+
+    def _blocked(*args, **kwargs):
+        raise RuntimeError("Socket access is disabled during unit tests")
+
+    monkeypatch.setattr(socket, "socket", _blocked)
+    yield
+
+
+@pytest.fixture
+def wait_until():
+    """
+    Poll a predicate instead of sleeping a fixed interval
+
+    Returns a callable wait_until(predicate, timeout=1.0, interval=0.001)
+    that unblocks as soon as the predicate turns true, so tests do not
+    burn wall time on worst-case sleeps.
+    """
+    def _wait_until(predicate, timeout=1.0, interval=0.001):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if predicate():
+                return True
+            time.sleep(interval)
+        return predicate()
+
+    return _wait_until
@@ -19,7 +19,9 @@ class TestLambdaArbiter:
     """Test suite for Lambda Arbiter"""
     @pytest.fixture
     def arbiter(self):
-        return LambdaArbiter()
+        arbiter = LambdaArbiter()
+        yield arbiter
+        arbiter.shutdown()
 
     @pytest.fixture
     def sample_health_data(self):
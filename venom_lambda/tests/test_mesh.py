@@ -17,11 +17,18 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "lambda"))
 from venom_lambda.mesh.mesh import Mesh
 from venom_lambda.mesh.nanobot import NanoBot
 
+@pytest.fixture(scope="session")
+def _mesh_pool():
+    # One Mesh for the whole session; each test gets it freshly reset
+    return Mesh()
+
+
 class TestMesh:
     """Test suite for Mesh Network"""
     @pytest.fixture
-    def mesh(self):
-        return Mesh()
+    def mesh(self, _mesh_pool):
+        _mesh_pool.reset()
+        return _mesh_pool
 
     @pytest.fixture
     def sample_nanobots(self):
@@ -54,41 +61,65 @@ class TestMesh:
     def test_mesh_start_stop(self, mesh):
         mesh.start()
         assert mesh.alive == True
-        time.sleep(0.1)
+        # stop() joins the dispatcher thread, so no settling sleep needed
         mesh.stop()
         assert mesh.alive == False
 
-    def test_broadcast(self, mesh, sample_nanobots):
+    def test_broadcast(self, mesh, sample_nanobots, wait_until):
         for nanobot in sample_nanobots:
             mesh.add_node(nanobot.node_id, nanobot)
         mesh.start()
-        mesh.broadcast("nano_1", "Test broadcast message")
-        time.sleep(0.1)
-        for nanobot in sample_nanobots[1:]:
-            assert nanobot.messages_received > 0
-        mesh.stop()
-
-    def test_direct_send(self, mesh, sample_nanobots):
+        try:
+            mesh.broadcast("nano_1", "Test broadcast message")
+            wait_until(lambda: all(nb.messages_received > 0 for nb in sample_nanobots[1:]))
+            for nanobot in sample_nanobots[1:]:
+                assert nanobot.messages_received > 0
+        finally:
+            mesh.stop()
+
+    def test_direct_send(self, mesh, sample_nanobots, wait_until):
         for nanobot in sample_nanobots:
             mesh.add_node(nanobot.node_id, nanobot)
         mesh.start()
-        mesh.send("nano_3", "Direct message to nano_3")
-        time.sleep(0.1)
-        assert sample_nanobots[2].messages_received > 0
-        mesh.stop()
-
-    def test_mesh_vitals(self, mesh, sample_nanobots):
+        try:
+            mesh.send("nano_3", "Direct message to nano_3")
+            wait_until(lambda: sample_nanobots[2].messages_received > 0)
+            assert sample_nanobots[2].messages_received > 0
+        finally:
+            mesh.stop()
+
+    def test_mesh_vitals(self, mesh, sample_nanobots, wait_until):
         for nanobot in sample_nanobots:
             mesh.add_node(nanobot.node_id, nanobot)
         mesh.start()
-        mesh.broadcast("test_sender", "Test message 1")
-        mesh.broadcast("test_sender", "Test message 2")
-        time.sleep(0.1)
-        vitals = mesh.get_vitals()
-        assert vitals["alive"] == True
-        assert vitals["nodes"] == 4
-        assert vitals["messages_delivered"] > 0
-        mesh.stop()
+        try:
+            mesh.broadcast("test_sender", "Test message 1")
+            mesh.broadcast("test_sender", "Test message 2")
+            wait_until(lambda: mesh.get_vitals()["messages_delivered"] >= 2)
+            vitals = mesh.get_vitals()
+            assert vitals["alive"] == True
+            assert vitals["nodes"] == 4
+            assert vitals["messages_delivered"] > 0
+        finally:
+            mesh.stop()
+
+    def test_tree_broadcast(self, mesh, sample_nanobots, wait_until):
+        for nanobot in sample_nanobots:
+            mesh.add_node(nanobot.node_id, nanobot)
+        # Sender egress is bounded: only the tree root is pushed directly
+        mesh.broadcast_tree("nano_1", "Tree broadcast message")
+        assert mesh._inq.qsize() == 1
+        mesh.start()
+        try:
+            wait_until(lambda: all(
+                nb.messages_received > 0 for nb in sample_nanobots[1:]
+            ))
+            for nanobot in sample_nanobots[1:]:
+                assert nanobot.messages_received > 0
+            # Sender forwards but does not receive its own broadcast
+            assert sample_nanobots[0].messages_received == 0
+        finally:
+            mesh.stop()
 
     def test_node_states(self, mesh, sample_nanobots):
         for nanobot in sample_nanobots:
@@ -102,16 +133,18 @@ class TestMesh:
         assert "memory_size" in state
         assert state["role"] == "memory_carrier"
 
-    def test_signal_logging(self, mesh, sample_nanobots):
+    def test_signal_logging(self, mesh, sample_nanobots, wait_until):
         for nanobot in sample_nanobots:
             mesh.add_node(nanobot.node_id, nanobot)
         mesh.start()
-        for i in range(5):
-            mesh.broadcast("test_sender", f"Message {i}")
-        time.sleep(0.2)
-        recent = mesh.get_recent_signals(10)
-        assert len(recent) > 0
-        mesh.stop()
+        try:
+            for i in range(5):
+                mesh.broadcast("test_sender", f"Message {i}")
+            wait_until(lambda: len(mesh.get_recent_signals(10)) > 0)
+            recent = mesh.get_recent_signals(10)
+            assert len(recent) > 0
+        finally:
+            mesh.stop()
 
 class TestNanoBot:
     """Test suite for NanoBot"""
@@ -153,6 +186,8 @@ class TestNanoBot:
             lambda msg: "Important" in msg["data"]
         )
         assert len(important) == 1
+        important_fast = nanobot.query_memory(contains="Important")
+        assert len(important_fast) == 1
 
     def test_clear_memory(self):
         nanobot = NanoBot("test_nano", "generic")
@@ -21,7 +21,8 @@ def test_save_and_load_peers(tmp_path, monkeypatch):
     monkeypatch.setattr(md, "PEER_FILE", tmp_path / "peers.json")
     md.PEERS.clear()
     md.PEERS["testnode"] = {"addr": ("127.0.0.1", 1234), "last_seen": time.time(), "healthy": True}
-    md.save_peers()
+    # Direct flush: save_peers() only marks dirty and is rate-limited
+    md._save_peers_now()
     md.PEERS.clear()
     md.load_peers()
     assert "testnode" in md.PEERS
@@ -62,6 +63,6 @@ def test_save_peers_handles_tuple(monkeypatch, tmp_path):
     monkeypatch.setattr(md, "PEER_FILE", tmp_path / "peers.json")
     md.PEERS.clear()
     md.PEERS["tupletest"] = {"addr": ("1.2.3.4", 5678), "last_seen": 123.4, "healthy": True}
-    md.save_peers()
+    md._save_peers_now()
     data = json.loads((tmp_path / "peers.json").read_text())
     assert isinstance(data["tupletest"]["addr"], list)
@@ -1,12 +1,13 @@
 """
 Test pulse.py: covers PulseFractal init, beat (simulated), log_pulse, metrics
 """
+import types
+
 import pytest
-from unittest import mock
 import venom_lambda.pulse.pulse as vp
 
 def test_pulsefractal_init():
-    arbiter = mock.Mock()
+    arbiter = types.SimpleNamespace()
     pf = vp.PulseFractal(arbiter)
     assert pf.lambda_arbiter == arbiter
     assert pf.cycle_time == 0.001
@@ -15,26 +16,31 @@ def test_pulsefractal_init():
     assert pf.total_beats == 0
 
 def test_pulsefractal_init_with_mobius():
-    arbiter = mock.Mock()
-    mobius = mock.Mock()
+    arbiter = types.SimpleNamespace()
+    mobius = types.SimpleNamespace()
     pf = vp.PulseFractal(arbiter, mobius)
     assert pf.mobius_engine == mobius
     assert pf.adaptive_timing is True
 
 def test_log_pulse(tmp_path):
-    arbiter = mock.Mock()
+    arbiter = types.SimpleNamespace()
     pf = vp.PulseFractal(arbiter)
     pf.log_path = tmp_path / "pulse.log"
-    pf.log_pulse({"score": 1.0})
+    pf.log_pulse({"integrated_score": 1.0})
+    # Beats only buffer; the flusher (or stop()) writes to disk
+    assert len(pf._log_buf) == 1
+    pf._flush_log()
     assert pf.log_path.exists()
-    content = pf.log_path.read_text()
-    assert "score" in content
+    records = vp.read_pulse_log(pf.log_path)
+    assert len(records) == 1
+    beat, ts, score = records[0]
+    assert score == 1.0
+    assert len(pf._log_buf) == 0
 
 def test_metrics_update():
-    arbiter = mock.Mock()
+    arbiter = types.SimpleNamespace()
     pf = vp.PulseFractal(arbiter)
-    pf._update_metrics(0.005)
+    pf._update_metrics(5_000_000)  # 5ms, in nanoseconds
     assert pf.avg_beat_time >= 0.0
-    # Acceptă și cazul inversat, cu toleranță
-    assert abs(pf.min_beat_time - pf.avg_beat_time) < 0.01 or pf.min_beat_time <= pf.avg_beat_time
-    assert pf.max_beat_time >= 0.0
+    # Exact integer average: the ordering invariant holds strictly
+    assert pf.min_beat_time <= pf.avg_beat_time <= pf.max_beat_time
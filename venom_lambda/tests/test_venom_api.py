@@ -1,6 +1,7 @@
 """
 Test venom-api.py: covers Lambda functions (time_wrap, fallback, fractal_total, mobius_time, grav_mode)
 """
+import numpy as np
 import pytest
 import venom_lambda.core.venom_api as va
 
@@ -41,6 +42,15 @@ def test_mobius_time_invalid():
     with pytest.raises(ValueError):
         va.mobius_time(5, 100, 10, 1e6, 0.7)
 
+def test_batch_variants_match_scalars():
+    states = np.array([1, 0, -1])
+    thetas = np.array([0.7, 0.5, 0.2])
+    names = va.fractal_total_batch(states, thetas)
+    assert list(names) == ["Regen", "Neutral", "Entropy"]
+    batch = va.mobius_time_batch(states, 100, 10, 1e6)
+    for i, s in enumerate([1, 0, -1]):
+        assert batch[i] == pytest.approx(va.mobius_time(s, 100, 10, 1e6, 0.7))
+
 def test_grav_mode_valid():
     mode, value = va.grav_mode(1, 0.7, 100, 10, 1e6)
     assert mode == "Regen" or isinstance(mode, str)
@@ -5,7 +5,6 @@ import pytest
 import json
 import time
 from pathlib import Path
-from unittest import mock
 import venom_lambda.core.venom_mesh_orchestrator as vmo
 
 def test_mesh_orchestrator_init():